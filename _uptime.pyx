@@ -0,0 +1,82 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Compiled merge kernel for the charger uptime calculator.
+
+Optional: build with `python setup.py build_ext --inplace`. When the
+extension is importable, charger_uptime routes large stations here; when
+it is not, the pure-Python kernel is used instead.
+"""
+
+from libc.stdlib cimport malloc, free, qsort
+
+ctypedef long long int64
+
+
+cdef struct Interval:
+    int64 start
+    int64 end
+
+
+cdef int _cmp_interval(const void *a, const void *b) noexcept nogil:
+    cdef int64 sa = (<const Interval *> a).start
+    cdef int64 sb = (<const Interval *> b).start
+    if sa < sb:
+        return -1
+    elif sa > sb:
+        return 1
+    return 0
+
+
+def uptime(const int64[::1] starts, const int64[::1] ends,
+           int64 period_start, int64 period_end):
+    """
+    Merged coverage of the intervals, clipped to [period_start, period_end].
+
+    Takes the endpoints as contiguous int64 buffers (array('q') or NumPy
+    int64 arrays), qsorts them as packed structs, and runs the same
+    running-merge plus clipped accumulate loop as the Python kernel,
+    entirely in C.
+    """
+    cdef Py_ssize_t n = starts.shape[0]
+    if n == 0:
+        return 0
+
+    cdef Interval *intervals = <Interval *> malloc(n * sizeof(Interval))
+    if intervals == NULL:
+        raise MemoryError()
+
+    cdef Py_ssize_t i
+    cdef int64 total = 0
+    cdef int64 current_start, current_end, start, end, lo, hi
+    try:
+        for i in range(n):
+            intervals[i].start = starts[i]
+            intervals[i].end = ends[i]
+        qsort(intervals, n, sizeof(Interval), _cmp_interval)
+
+        current_start = intervals[0].start
+        current_end = intervals[0].end
+        for i in range(1, n):
+            if current_start <= period_start and current_end >= period_end:
+                return period_end - period_start
+            start = intervals[i].start
+            end = intervals[i].end
+            if start <= current_end:
+                if end > current_end:
+                    current_end = end
+            else:
+                lo = max(current_start, period_start)
+                hi = min(current_end, period_end)
+                if lo < hi:
+                    total += hi - lo
+                current_start = start
+                current_end = end
+
+        lo = max(current_start, period_start)
+        hi = min(current_end, period_end)
+        if lo < hi:
+            total += hi - lo
+
+        return total
+    finally:
+        free(intervals)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Optional build script for the compiled merge kernel.
+
+    python setup.py build_ext --inplace
+
+Requires Cython and a C compiler. The calculator works without the
+extension; charger_uptime falls back to its pure-Python kernel when
+_uptime is not importable.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="charger-uptime",
+    ext_modules=cythonize("_uptime.pyx", language_level=3),
+)
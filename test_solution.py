@@ -7,13 +7,14 @@ import unittest
 import tempfile
 import os
 import sys
+from array import array
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
 
 # Import the functions from our solution
 from charger_uptime import (
-    parse_input_file, 
-    get_station_reporting_period,
+    parse_input_file,
+    bucket_reports,
     merge_intervals,
     calculate_station_uptime,
     main
@@ -45,12 +46,13 @@ class TestChargerUptime(unittest.TestCase):
             stations, reports = parse_input_file(temp_file)
             
             expected_stations = {0: [1001, 1002], 1: [1003]}
-            expected_reports = [
-                (1001, 0, 100, True),
-                (1002, 50, 150, False),
-                (1003, 25, 75, True)
-            ]
-            
+            expected_reports = (
+                array('q', [1001, 1002, 1003]),
+                array('q', [0, 50, 25]),
+                array('q', [100, 150, 75]),
+                bytearray([1, 0, 1])
+            )
+
             self.assertEqual(stations, expected_stations)
             self.assertEqual(reports, expected_reports)
         finally:
@@ -82,7 +84,12 @@ class TestChargerUptime(unittest.TestCase):
             stations, reports = parse_input_file(temp_file)
 
             expected_stations = {0: [1001]}
-            expected_reports = [(1001, 0, 100, True)]
+            expected_reports = (
+                array('q', [1001]),
+                array('q', [0]),
+                array('q', [100]),
+                bytearray([1])
+            )
 
             self.assertEqual(stations, expected_stations)
             self.assertEqual(reports, expected_reports)
@@ -121,6 +128,32 @@ class TestChargerUptime(unittest.TestCase):
         finally:
             os.unlink(temp_file)
 
+    def test_unsigned_64bit_timestamps(self):
+        """Test that timestamps up to the unsigned 64-bit limit are handled."""
+        big_start = 2 ** 64 - 2
+        big_end = 2 ** 64 - 1
+        content = f"""[Stations]
+0 1001
+
+[Charger Availability Reports]
+1001 {big_start} {big_end} true"""
+
+        temp_file = self.create_temp_file(content)
+        try:
+            stations, reports = parse_input_file(temp_file)
+            charger_col, start_col, end_col, up_col = reports
+
+            # Values past the signed 64-bit range spill to list columns
+            self.assertIsInstance(start_col, list)
+            self.assertEqual(list(start_col), [big_start])
+            self.assertEqual(list(end_col), [big_end])
+
+            reports_rows = [(1001, big_start, big_end, True)]
+            uptime = calculate_station_uptime(0, [1001], bucket_reports(reports_rows))
+            self.assertEqual(uptime, 100)
+        finally:
+            os.unlink(temp_file)
+
     def test_negative_timestamps(self):
         """Test that negative timestamps result in ERROR."""
         content = """[Stations]
@@ -163,26 +196,26 @@ class TestChargerUptime(unittest.TestCase):
         expected = []
         self.assertEqual(merged, expected)
     
-    def test_get_station_reporting_period(self):
-        """Test calculation of station reporting periods."""
+    def test_bucket_reports(self):
+        """Test grouping of reports by charger ID."""
         reports = [
             (1001, 0, 100, True),
             (1001, 200, 300, False),
             (1002, 50, 150, True),
             (1003, 25, 75, True)
         ]
-        
-        # Station with chargers 1001, 1002
-        period = get_station_reporting_period([1001, 1002], reports)
-        self.assertEqual(period, (0, 300))  # min=0, max=300
-        
-        # Station with charger 1003 only
-        period = get_station_reporting_period([1003], reports)
-        self.assertEqual(period, (25, 75))
-        
-        # Station with no reports
-        period = get_station_reporting_period([9999], reports)
-        self.assertEqual(period, (0, 0))
+
+        by_charger = bucket_reports(reports)
+
+        expected = {
+            1001: [(1001, 0, 100, True), (1001, 200, 300, False)],
+            1002: [(1002, 50, 150, True)],
+            1003: [(1003, 25, 75, True)]
+        }
+        self.assertEqual(by_charger, expected)
+
+        # Empty input yields empty buckets
+        self.assertEqual(bucket_reports([]), {})
     
     def test_calculate_station_uptime_basic(self):
         """Test basic uptime calculations."""
@@ -195,7 +228,7 @@ class TestChargerUptime(unittest.TestCase):
         # Station 0 has chargers 1001, 1002
         # Total period: 0-100 (100 units)
         # Station is up entire time (at least one charger up)
-        uptime = calculate_station_uptime(0, [1001, 1002], reports)
+        uptime = calculate_station_uptime(0, [1001, 1002], bucket_reports(reports))
         self.assertEqual(uptime, 100)
     
     def test_calculate_station_uptime_with_gaps(self):
@@ -209,7 +242,7 @@ class TestChargerUptime(unittest.TestCase):
         # Total period: 0-200 (200 units)
         # Uptime: 50 + 100 = 150 units
         # Percentage: 150/200 * 100 = 75%
-        uptime = calculate_station_uptime(2, [1004], reports)
+        uptime = calculate_station_uptime(2, [1004], bucket_reports(reports))
         self.assertEqual(uptime, 75)
     
     def test_calculate_station_uptime_all_down(self):
@@ -222,7 +255,7 @@ class TestChargerUptime(unittest.TestCase):
         # Total period: 25-75 (50 units)
         # Uptime: 0 units
         # Percentage: 0%
-        uptime = calculate_station_uptime(1, [1003], reports)
+        uptime = calculate_station_uptime(1, [1003], bucket_reports(reports))
         self.assertEqual(uptime, 0)
     
     def test_calculate_station_uptime_no_reports(self):
@@ -230,7 +263,7 @@ class TestChargerUptime(unittest.TestCase):
         reports = []
         
         # Station with no reports should have 0% uptime
-        uptime = calculate_station_uptime(0, [1001], reports)
+        uptime = calculate_station_uptime(0, [1001], bucket_reports(reports))
         self.assertEqual(uptime, 0)
     
     def test_rounding_down(self):
@@ -245,7 +278,7 @@ class TestChargerUptime(unittest.TestCase):
         # Total period: 0-30 (30 units)
         # Uptime: 10 units
         # Percentage: 10/30 * 100 = 33.33%, should round down to 33
-        uptime = calculate_station_uptime(0, [1001], reports)
+        uptime = calculate_station_uptime(0, [1001], bucket_reports(reports))
         self.assertEqual(uptime, 33)
 
 